@@ -46,6 +46,10 @@ export const experimentSchema = z.object({
   status: experimentStatusEnum.default('draft')
 });
 
+export const experimentBatchSchema = z.object({
+  ids: z.array(z.string().min(1)).min(1).max(500)
+});
+
 export const experimentUpdateSchema = experimentSchema.partial().refine(
   (val) => Object.keys(val).length > 0,
   { message: 'At least one field must be provided for update' }
@@ -183,6 +187,25 @@ export function createExperimentsRoutes(
     res.json(experiment);
   }));
 
+  // ==================== GET EXPERIMENTS BY ID ====================
+
+  // POST so large id lists stay out of the URL; returns the same shape as
+  // the list endpoint, omitting ids that are missing or not visible.
+  router.post('/experiments/batch', asyncHandler(async (req, res) => {
+    const user = (req as any).user as User;
+    const parse = experimentBatchSchema.safeParse(req.body);
+
+    if (!parse.success) {
+      throw new ValidationError('Invalid batch request', parse.error.flatten());
+    }
+
+    const where = user.role === 'manager' || user.role === 'admin'
+      ? { id: { in: parse.data.ids } }
+      : { id: { in: parse.data.ids }, userId: user.id };
+    const data = await prisma.experiment.findMany({ where });
+    res.json(data);
+  }));
+
   // ==================== SEARCH RESULTS ====================
 
   router.get('/search/results', searchResultsLimiter, asyncHandler(async (req, res) => {
@@ -67,6 +67,10 @@ const stockSchema = z.object({
   notes: z.string().optional()
 });
 
+const stockBatchSchema = z.object({
+  ids: z.array(z.string().min(1)).min(1).max(500)
+});
+
 const INVENTORY_IMPORT_MAX_BYTES = 50 * 1024 * 1024; // 50MB
 const INVENTORY_IMPORT_MAX_ROWS = 10000;
 const IMPORTS_DIR = process.env.IMPORTS_DIR || path.join(process.cwd(), 'data', 'imports');
@@ -1451,6 +1455,22 @@ export function createInventoryRoutes(prisma: PrismaClient): Router {
     }
   });
 
+  router.post('/stock/batch', async (req, res) => {
+    const parse = stockBatchSchema.safeParse(req.body);
+    if (!parse.success) {
+      return res.status(400).json({ error: parse.error.flatten() });
+    }
+    try {
+      const stocks = await prisma.stock.findMany({
+        where: { id: { in: parse.data.ids } },
+        include: { item: true, location: true }
+      });
+      res.json(stocks);
+    } catch (error) {
+      res.status(500).json({ error: 'Database error' });
+    }
+  });
+
   router.post('/stock', async (req, res) => {
     const parse = stockSchema.safeParse(req.body);
     if (!parse.success) {
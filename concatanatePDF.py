@@ -4,6 +4,15 @@ import argparse
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
+import collections
+import queue
+import time
+import mmap
+import re
+import gc
+import contextlib
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     from pypdf import PdfWriter, PdfReader
@@ -24,21 +33,172 @@ except ModuleNotFoundError as e:
     raise
 
 
-def _write_batch(file_list, output_path, index, log):
-    output_filename = f"Collated_Part_{index:03d}.pdf"
-    full_output_path = os.path.join(output_path, output_filename)
+# Below this many files the process pool start-up costs more than it saves.
+_SERIAL_THRESHOLD = 16
+_WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+_PROBE_BYTES = 1024
+_TRAILER_BYTES = 64 * 1024
+_PROBE_WORKERS = 64
+# ProcessPoolExecutor refuses more workers than this on Windows.
+_MAX_POOL_WORKERS = 61
+# Rough memory budget shared by batches being written at the same time.
+_WRITER_MEMORY_BYTES = 2 * 1024 * 1024 * 1024
+_ENCRYPT_KEY = re.compile(rb"/Encrypt\b")
+_STATUS_INTERVAL = 0.1
+_POLL_MS = 50
+
+
+def _throttled(status, interval=_STATUS_INTERVAL):
+    # Drop updates that arrive faster than the status bar can usefully show.
+    last = 0.0
+
+    def update(message):
+        nonlocal last
+        now = time.monotonic()
+        if now - last >= interval:
+            last = now
+            status(message)
+
+    return update
+
+
+@contextlib.contextmanager
+def _quiet_gc():
+    # Freeze everything alive so far (GUI, modules) out of the collector's
+    # view and collect less often while pypdf churns through objects; each
+    # batch is collected explicitly once it has been written.
+    gc.collect()
+    gc.freeze()
+    thresholds = gc.get_threshold()
+    gc.set_threshold(50000, 10, 10)
+    try:
+        yield
+    finally:
+        gc.set_threshold(*thresholds)
+        gc.unfreeze()
 
-    log(f"Writing {output_filename} ({len(file_list)} files)...")
-    merger = PdfWriter()
+
+def _fast_pdf_probe(path):
+    # Returns (looks_like_pdf, needs_parse, size) from a 1 KiB header
+    # read and a read-only mmap of the last 64 KiB, without building any PDF
+    # objects. The size comes from the open handle, so later phases need no
+    # further stat calls.
+    size = 0
     try:
-        for pdf in file_list:
-            try:
-                merger.append(pdf, import_outline=False)
-            except Exception as e:
-                log(f" >> SKIP (append failed): {os.path.basename(pdf)} ({e})")
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return False, False, size
+            head = f.read(_PROBE_BYTES)
+            offset = max(0, size - _TRAILER_BYTES)
+            offset -= offset % mmap.ALLOCATIONGRANULARITY
+            with mmap.mmap(f.fileno(), size - offset, offset=offset, access=mmap.ACCESS_READ) as tail:
+                has_eof = tail.rfind(b"%%EOF") != -1
+                has_encrypt = _ENCRYPT_KEY.search(tail) is not None
+    except (OSError, ValueError):
+        return False, False, size
+    if b"%PDF-" not in head:
+        return False, False, size
+    # pypdf tolerates a missing or far-off %%EOF, so such files get a full
+    # parse rather than being excluded. Linearized files keep their full
+    # trailer near the start, so the tail alone cannot rule out encryption.
+    return True, not has_eof or has_encrypt or b"/Linearized" in head, size
+
+
+def _fails_to_open(path):
+    try:
+        reader = PdfReader(path)
+        if reader.is_encrypted:
+            _ = len(reader.pages)
+    except Exception:
+        return True
+    return False
 
-        with open(full_output_path, "wb") as f_out:
+
+def _opens_cleanly(path):
+    # The scan only probes most files, so a single-file batch is parsed once
+    # before it is copied through untouched.
+    try:
+        with open(path, "rb") as f:
+            reader = PdfReader(f)
+            if reader.is_encrypted:
+                return False
+            for _ in reader.pages:
+                pass
+    except Exception:
+        return False
+    return True
+
+
+def _validate_one(path):
+    looks_like_pdf, needs_parse, size = _fast_pdf_probe(path)
+    # Only files the probe cannot vouch for pay for a full parse.
+    is_locked = not looks_like_pdf or (needs_parse and _fails_to_open(path))
+    return os.path.basename(path), is_locked, size
+
+
+def _iter_validated(paths):
+    if len(paths) < _SERIAL_THRESHOLD:
+        yield from map(_validate_one, paths)
+        return
+
+    # Probes are a couple of small reads each, so many run at once on
+    # threads. The few files that need a full pypdf parse go to processes,
+    # since that parse holds the GIL. Results are yielded in input order as
+    # soon as they are known.
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=_PROBE_WORKERS) as probes, \
+            ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, _MAX_POOL_WORKERS)) as parsers:
+        for path, (looks_like_pdf, needs_parse, size) in zip(paths, probes.map(_fast_pdf_probe, paths)):
+            if looks_like_pdf and needs_parse:
+                locked = parsers.submit(_fails_to_open, path)
+            else:
+                locked = Future()
+                locked.set_result(not looks_like_pdf)
+            pending.append((os.path.basename(path), locked, size))
+            while pending and pending[0][1].done():
+                filename, locked, size = pending.popleft()
+                yield filename, locked.result(), size
+        for filename, locked, size in pending:
+            yield filename, locked.result(), size
+
+
+def _build_writer(file_list, log):
+    # Returns the writer and the names of inputs that could not be appended;
+    # most files are only probed during the scan, so this is where damaged
+    # ones are found.
+    merger = PdfWriter()
+    failed = []
+    for pdf in file_list:
+        # Plain page copies: outlines, named destinations and form fields
+        # are deliberately not carried over, which also skips the
+        # reconciliation work PdfWriter.append would do for them.
+        start = len(merger.pages)
+        try:
+            # Given a path, PdfReader first copies the whole file into
+            # memory; reading from an open file only pulls in the objects
+            # add_page copies, and those are copied eagerly, so the file
+            # can be closed straight away.
+            with open(pdf, "rb") as f_in:
+                reader = PdfReader(f_in)
+                for page in reader.pages:
+                    merger.add_page(page)
+        except Exception as e:
+            del merger.pages[start:]
+            failed.append(os.path.basename(pdf))
+            log(f" >> SKIP (append failed): {os.path.basename(pdf)} ({e})")
+    return merger, failed
+
+
+def _flush_writer(merger, full_output_path, output_filename, log):
+    try:
+        with open(full_output_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f_out:
             merger.write(f_out)
+            f_out.flush()
+            os.fsync(f_out.fileno())
+            # The output is not read back, so keep it from evicting the inputs.
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f_out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         log(f"Saved: {output_filename}")
     finally:
         try:
@@ -47,7 +207,176 @@ def _write_batch(file_list, output_path, index, log):
             pass
 
 
-def collate_pdfs(source_path, output_path, target_bytes, log, status=None):
+def _write_batch(file_list, output_path, index, log, writer_pool=None):
+    # Returns (failed, flush): the inputs skipped because they could not be
+    # read, and the pending write when a writer_pool was given.
+    output_filename = f"Collated_Part_{index:03d}.pdf"
+    full_output_path = os.path.join(output_path, output_filename)
+
+    log(f"Writing {output_filename} ({len(file_list)} files)...")
+    if len(file_list) == 1 and _opens_cleanly(file_list[0]):
+        # Nothing to merge, so skip the re-serialise; copyfile uses
+        # sendfile/copy_file_range where the platform offers them. Files
+        # that fail the check go through the writer, which reports them.
+        shutil.copyfile(file_list[0], full_output_path)
+        log(f"Saved: {output_filename}")
+        return [], None
+
+    merger, failed = _build_writer(file_list, log)
+    if not merger.pages:
+        merger.close()
+        log(f"Not written: {output_filename} (no readable files; the next part takes its number)")
+        return failed, None
+    if writer_pool is not None:
+        # The caller builds the next batch while this one is written out.
+        return failed, writer_pool.submit(_flush_writer, merger, full_output_path, output_filename, log)
+
+    _flush_writer(merger, full_output_path, output_filename, log)
+    # The writer holds every object copied from every input; release it
+    # now rather than when the next batch happens to trigger a collection.
+    del merger
+    gc.collect()
+    return failed, None
+
+
+def _pack_greedy(sized, target_bytes):
+    # Yields each batch as soon as it is full, so callers can start writing
+    # it before the rest of the input has been scanned.
+    current_batch = []
+    current_batch_size = 0
+    append = current_batch.append
+
+    for path, file_size in sized:
+        if current_batch and (current_batch_size + file_size > target_bytes):
+            yield current_batch
+            current_batch = []
+            current_batch_size = 0
+            append = current_batch.append
+
+        append(path)
+        current_batch_size += file_size
+
+    if current_batch:
+        yield current_batch
+
+
+def _pack_ffd(sized, target_bytes):
+    # First-fit decreasing: place the largest files first, each into the
+    # first batch with room. Files keep filename order within a batch and
+    # batches are ordered by their first file, but files from different
+    # parts of the listing can share a batch, so reading the outputs in
+    # sequence does not follow filename order.
+    paths = [path for path, _ in sized]
+    sizes = [file_size for _, file_size in sized]
+    bins = []
+    free = []
+    open_bin = bins.append
+    open_room = free.append
+    for i in sorted(range(len(sizes)), key=sizes.__getitem__, reverse=True):
+        file_size = sizes[i]
+        for b, room in enumerate(free):
+            if file_size <= room:
+                bins[b].append(i)
+                free[b] -= file_size
+                break
+        else:
+            open_bin([i])
+            open_room(target_bytes - file_size)
+
+    for members in bins:
+        members.sort()
+    bins.sort(key=lambda members: members[0])
+    return [[paths[i] for i in members] for members in bins]
+
+
+_PACK_STRATEGIES = ("greedy", "ffd")
+
+
+def _write_batch_job(file_list, output_path, index):
+    # Worker processes cannot call back into the parent's log, so collect the
+    # lines and hand them back with the result.
+    lines = []
+    failed, _ = _write_batch(file_list, output_path, index, lines.append)
+    return lines, failed
+
+
+def _writer_workers(target_bytes, jobs=None):
+    if jobs:
+        return max(1, min(jobs, _MAX_POOL_WORKERS))
+    # Each worker holds a whole batch in a PdfWriter, which takes a few
+    # times the batch's size on disk, so large targets get fewer workers.
+    per_writer = max(target_bytes, 1) * 3
+    cpus = min(os.cpu_count() or 1, _MAX_POOL_WORKERS)
+    return max(1, min(cpus, int(_WRITER_MEMORY_BYTES // per_writer)))
+
+
+def _write_batches(batches, output_path, log, status=None, serial=False, on_skip=None, workers=None):
+    # Returns the number of output files written. Inputs that fail to append
+    # are passed to on_skip, batch by batch in order. A batch with no
+    # readable files writes nothing and does not use up a part number.
+    written = 0
+
+    def finished(batch, failed):
+        nonlocal written
+        if failed and on_skip:
+            on_skip(failed)
+        if len(failed) < len(batch):
+            written += 1
+
+    if serial:
+        # One writer thread overlaps each batch's write and fsync with
+        # building the next; waiting on it before queueing another keeps at
+        # most two writers in memory.
+        flushing = None
+        with ThreadPoolExecutor(max_workers=1) as writer_pool:
+            for batch in batches:
+                failed, flush = _write_batch(batch, output_path, written + 1, log, writer_pool)
+                finished(batch, failed)
+                if flushing is not None:
+                    flushing.result()
+                    gc.collect()
+                flushing = flush
+                if status:
+                    status(f"Collating: batch {written}...")
+            if flushing is not None:
+                flushing.result()
+        return written
+
+    # Replay worker logs in batch order so the log reads the same as a
+    # serial run. Part numbers are handed out before a batch is known to
+    # be empty, so later parts are renamed to close any gap.
+    def drain(block):
+        while pending and (block or pending[0][2].done()):
+            index, batch, future = pending.popleft()
+            lines, failed = future.result()
+            for line in lines:
+                log(line)
+            finished(batch, failed)
+            if len(failed) < len(batch) and written != index:
+                old_name = f"Collated_Part_{index:03d}.pdf"
+                new_name = f"Collated_Part_{written:03d}.pdf"
+                os.replace(os.path.join(output_path, old_name), os.path.join(output_path, new_name))
+                log(f"Renamed: {old_name} -> {new_name}")
+            if status:
+                status(f"Collating: batch {index}/{count}...")
+
+    # Copying pages is pure-Python pypdf work that holds the GIL, so batches
+    # are written in separate processes rather than threads. `batches` may be a
+    # lazy iterator still being fed by the scan; each batch is submitted as
+    # soon as it is produced.
+    pending = collections.deque()
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for count, batch in enumerate(batches, start=1):
+            pending.append((count, batch, pool.submit(_write_batch_job, batch, output_path, count)))
+            drain(block=False)
+        drain(block=True)
+    return written
+
+
+def collate_pdfs(source_path, output_path, target_bytes, log, status=None, pack="greedy", jobs=None):
+    if pack not in _PACK_STRATEGIES:
+        raise ValueError(f"Unknown packing strategy: {pack}")
     if not os.path.isdir(source_path):
         raise ValueError(f"Source folder does not exist: {source_path}")
     if not os.path.isdir(output_path):
@@ -55,86 +384,80 @@ def collate_pdfs(source_path, output_path, target_bytes, log, status=None):
 
     log(f"Scanning {source_path}...")
 
-    all_files = [f for f in os.listdir(source_path) if f.lower().endswith(".pdf")]
-    all_files.sort()
-    if not all_files:
+    with os.scandir(source_path) as it:
+        # Lowercasing only the last four characters beats lower() on the whole name.
+        entries = [e for e in it if e.name[-4:].lower() == ".pdf"]
+    entries.sort(key=lambda e: e.name)
+    if not entries:
         raise ValueError("No PDF files found in source directory.")
 
-    total_scan_count = len(all_files)
+    if status:
+        status = _throttled(status)
 
-    log("Phase 1: Scanning for locked/corrupt files...")
+    total_scan_count = len(entries)
+    serial = total_scan_count < _SERIAL_THRESHOLD
+    workers = _writer_workers(target_bytes, jobs)
     valid_files = []
     excluded_files = []
 
-    for i, filename in enumerate(all_files):
-        file_path = os.path.join(source_path, filename)
+    def scan():
+        scanned = _iter_validated([e.path for e in entries])
+        for i, (entry, (filename, is_locked, file_size)) in enumerate(zip(entries, scanned)):
+            if status:
+                status(f"Scanning: {i + 1}/{total_scan_count}...")
 
-        is_locked = False
-        try:
-            reader = PdfReader(file_path)
-            if reader.is_encrypted:
-                try:
-                    _ = len(reader.pages)
-                except Exception:
-                    is_locked = True
-        except Exception:
-            is_locked = True
+            if is_locked:
+                excluded_files.append(filename)
+                log(f" >> EXCLUDED: {filename} (Locked/Corrupt)")
+                continue
 
-        if is_locked:
-            excluded_files.append(filename)
-            log(f" >> EXCLUDED: {filename} (Locked/Corrupt)")
-        else:
             valid_files.append(filename)
+            yield entry.path, file_size
 
-        if status and i % 5 == 0:
-            status(f"Scanning: {i + 1}/{total_scan_count}...")
-
-    if excluded_files:
-        log("\n--- EXCLUSION REPORT ---")
-        log(f"Skipped {len(excluded_files)} files (see above).")
-        log(f"Proceeding with {len(valid_files)} valid files.")
-        log("------------------------\n")
-    else:
-        log("Scan complete. All files are valid.\n")
-
-    if not valid_files:
-        raise ValueError("All files were excluded (locked or corrupt).")
-
-    log(f"Phase 2: Collating {len(valid_files)} files...")
-
-    current_batch = []
-    current_batch_size = 0
-    batch_index = 1
-    total_valid = len(valid_files)
-
-    for i, filename in enumerate(valid_files):
-        file_path = os.path.join(source_path, filename)
-        try:
-            file_size = os.path.getsize(file_path)
-        except OSError:
-            log(f"Skipping {filename}: Could not read file size.")
-            continue
-
-        if current_batch and (current_batch_size + file_size > target_bytes):
-            _write_batch(current_batch, output_path, batch_index, log)
-            batch_index += 1
-            current_batch = []
-            current_batch_size = 0
-
-        current_batch.append(file_path)
-        current_batch_size += file_size
-
-        if status and i % 5 == 0:
-            status(f"Collating: {i + 1}/{total_valid}...")
+    def skip_unreadable(failed):
+        # Files that passed the scan but could not be appended while writing.
+        for filename in failed:
+            valid_files.remove(filename)
+            excluded_files.append(filename)
 
-    if current_batch:
-        _write_batch(current_batch, output_path, batch_index, log)
+    def report_exclusions():
+        if excluded_files:
+            log("\n--- EXCLUSION REPORT ---")
+            log(f"Skipped {len(excluded_files)} files (see above).")
+            log(f"Valid files: {len(valid_files)}.")
+            log("------------------------\n")
+        else:
+            log("Scan complete. All files are valid.\n")
+
+        if not valid_files:
+            raise ValueError("All files were excluded (locked or corrupt).")
+
+    with _quiet_gc():
+        if pack == "greedy":
+            # Greedy batches only depend on the files before them, so scanning
+            # and writing run as a pipeline instead of two phases.
+            log("Scanning for locked/corrupt files and collating...")
+            batch_count = _write_batches(
+                _pack_greedy(scan(), target_bytes), output_path, log, status, serial, skip_unreadable, workers
+            )
+        else:
+            log("Phase 1: Scanning for locked/corrupt files...")
+            sized = list(scan())
+            if not valid_files:
+                report_exclusions()
+
+            log(f"Phase 2: Collating {len(valid_files)} files...")
+            batch_count = _write_batches(
+                _pack_ffd(sized, target_bytes), output_path, log, status, serial, skip_unreadable, workers
+            )
+        # Reported after writing so files found unreadable then are included.
+        report_exclusions()
 
     return {
         "processed": len(valid_files),
         "skipped": len(excluded_files),
         "skipped_files": excluded_files,
-        "batches": batch_index,
+        "batches": batch_count,
     }
 
 class PDFCollatorApp:
@@ -148,9 +471,16 @@ class PDFCollatorApp:
         self.output_dir = tk.StringVar()
         self.target_size_str = tk.StringVar(value="80")
         self.status_var = tk.StringVar(value="Ready")
+        self.fewest_files = tk.BooleanVar(value=False)
         self.is_processing = False
 
+        # The worker thread never calls into Tk: it only queues log lines,
+        # status updates and its final outcome, and a recurring poll on the
+        # Tk thread applies them.
+        self._events = queue.SimpleQueue()
+
         self._create_ui()
+        self.root.after(_POLL_MS, self._poll_events)
 
     def _create_ui(self):
         # Main container
@@ -173,14 +503,23 @@ class PDFCollatorApp:
         settings_frame = ttk.LabelFrame(main_frame, text="Settings", padding="10")
         settings_frame.grid(row=4, column=0, columnspan=2, sticky="ew", pady=20)
         
-        ttk.Label(settings_frame, text="Max File Size (MB):").pack(side=tk.LEFT, padx=5)
+        size_row = ttk.Frame(settings_frame)
+        size_row.pack(fill=tk.X)
+
+        ttk.Label(size_row, text="Max File Size (MB):").pack(side=tk.LEFT, padx=5)
         
         # Presets
         presets = ["10", "25", "50", "80", "100", "150", "200", "500"]
-        size_combo = ttk.Combobox(settings_frame, textvariable=self.target_size_str, values=presets, width=10)
+        size_combo = ttk.Combobox(size_row, textvariable=self.target_size_str, values=presets, width=10)
         size_combo.pack(side=tk.LEFT, padx=5)
 
-        ttk.Label(settings_frame, text="(Approximate split point)").pack(side=tk.LEFT, padx=5)
+        ttk.Label(size_row, text="(Approximate split point)").pack(side=tk.LEFT, padx=5)
+
+        ttk.Checkbutton(
+            settings_frame,
+            text="Pack into the fewest files (PDFs may be reordered across parts)",
+            variable=self.fewest_files,
+        ).pack(anchor="w", padx=5, pady=(5, 0))
 
         # Log Area
         self.log_text = tk.Text(main_frame, height=12, width=60, state='disabled', font=("Consolas", 9))
@@ -215,10 +554,40 @@ class PDFCollatorApp:
             self.output_dir.set(path)
 
     def log(self, message):
-        self.log_text.config(state='normal')
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state='disabled')
+        self._events.put(("log", message))
+
+    def set_status(self, message):
+        self._events.put(("status", message))
+
+    def _poll_events(self):
+        lines = []
+        status = None
+        outcome = None
+        finished = False
+        try:
+            while True:
+                kind, payload = self._events.get_nowait()
+                if kind == "log":
+                    lines.append(payload)
+                elif kind == "status":
+                    status = payload
+                else:
+                    outcome = payload
+                    finished = True
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.log_text.config(state='normal')
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
+            self.log_text.config(state='disabled')
+        # Only the latest status is worth drawing.
+        if status is not None:
+            self.status_var.set(status)
+        if finished:
+            self.finish_processing(outcome)
+        self.root.after(_POLL_MS, self._poll_events)
 
     def start_processing_thread(self):
         if self.is_processing:
@@ -243,17 +612,19 @@ class PDFCollatorApp:
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state='disabled')
         
-        thread = threading.Thread(target=self.process_pdfs)
+        # Tk variables are read here, on the Tk thread, and handed over.
+        thread = threading.Thread(
+            target=self.process_pdfs,
+            args=(source, output, self.target_size_str.get(), "ffd" if self.fewest_files.get() else "greedy"),
+        )
         thread.daemon = True
         thread.start()
 
-    def process_pdfs(self):
+    def process_pdfs(self, source_path, output_path, size_text, pack="greedy"):
+        outcome = None
         try:
-            source_path = self.source_dir.get()
-            output_path = self.output_dir.get()
-            
             try:
-                size_mb = float(self.target_size_str.get())
+                size_mb = float(size_text)
                 target_bytes = size_mb * 1024 * 1024
             except ValueError:
                 self.log("Invalid size format. Defaulting to 80MB.")
@@ -264,7 +635,8 @@ class PDFCollatorApp:
                 output_path=output_path,
                 target_bytes=target_bytes,
                 log=self.log,
-                status=self.status_var.set,
+                status=self.set_status,
+                pack=pack,
             )
 
             self.log("Done! Processing complete.")
@@ -274,14 +646,14 @@ class PDFCollatorApp:
                 msg += f"\nSkipped: {result['skipped']} files (Locked/Corrupt)"
                 msg += "\n(Check log for list of skipped files)"
 
-            messagebox.showinfo("Success", msg)
+            outcome = (messagebox.showinfo, "Success", msg)
 
         except Exception as e:
             self.log(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            outcome = (messagebox.showerror, "Error", f"An error occurred: {str(e)}")
         
         finally:
-            self.finish_processing()
+            self._events.put(("done", outcome))
 
     def write_batch(self, file_list, output_path, index):
         try:
@@ -289,16 +661,34 @@ class PDFCollatorApp:
         except Exception as e:
             self.log(f"Failed to write Collated_Part_{index:03d}.pdf: {str(e)}")
 
-    def finish_processing(self):
+    def finish_processing(self, outcome=None):
         self.is_processing = False
         self.start_btn.config(state='normal')
         self.status_var.set("Ready")
+        if outcome is not None:
+            show, title, message = outcome
+            show(title, message)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Collate PDFs into batches by approximate max size.")
     parser.add_argument("--source", help="Source folder containing PDFs")
     parser.add_argument("--output", help="Output folder for collated PDFs")
     parser.add_argument("--size-mb", type=float, default=80.0, help="Max output file size in MB (approximate)")
+    parser.add_argument(
+        "--pack",
+        choices=_PACK_STRATEGIES,
+        default="greedy",
+        help=(
+            "Batching strategy: 'greedy' (default) splits in filename order; 'ffd' packs into "
+            "the fewest files but mixes files from different parts of the filename order "
+            "into the same output"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of batches written in parallel (default: based on CPU count and --size-mb)",
+    )
     args = parser.parse_args()
 
     if args.source and args.output:
@@ -310,6 +700,8 @@ if __name__ == "__main__":
                 target_bytes=target_bytes,
                 log=print,
                 status=lambda s: None,
+                pack=args.pack,
+                jobs=args.jobs,
             )
             print("Done! Processing complete.")
             print(f"Processed: {result['processed']} files")